@@ -13,24 +13,136 @@ Usage:
     python scripts/run-docjays-phases.py --resume-from 2
 """
 
-import subprocess
+import asyncio
+import mmap
 import sys
 import os
+import re
 import json
 import time
 import argparse
-from datetime import datetime
+import shlex
+import shutil
+import signal
+import threading
+from collections import namedtuple
+from contextlib import contextmanager
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from dataclasses import dataclass
 from enum import Enum
 
+if TYPE_CHECKING:
+    from datetime import datetime
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Fix Unicode encoding on Windows
 if sys.platform == "win32":
     import io
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
+_datetime_cls = None
+
+
+def _datetime():
+    """The datetime class, imported on first use to keep startup light"""
+    global _datetime_cls
+    if _datetime_cls is None:
+        from datetime import datetime as _datetime_cls
+    return _datetime_cls
+
+
+def _now() -> Tuple["datetime", str, str]:
+    """Current time as (datetime, ISO string, compact filename stamp)"""
+    dt = _datetime().now()
+    return dt, dt.isoformat(), dt.strftime('%Y%m%d_%H%M%S')
+
+
+def _epoch_to_iso(ts: Optional[float]) -> Optional[str]:
+    """Render epoch seconds as a local ISO timestamp"""
+    return None if ts is None else _datetime().fromtimestamp(ts).isoformat()
+
+
+def _to_epoch(value) -> Optional[float]:
+    """Read a stored time; progress files from older runs hold ISO strings"""
+    if isinstance(value, str):
+        return _datetime().fromisoformat(value).timestamp()
+    return value
+
+
+def _dumps(obj, indent: bool = True) -> bytes:
+    """Serialize to JSON bytes, using orjson when it is installed"""
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+def _loads(data):
+    """Parse JSON from bytes or a buffer, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(bytes(data))
+
+
+@contextmanager
+def _mapped(path: Path):
+    """Map a file read-only; yields None for an empty file"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield None
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _atomic_write(path: Path, data: bytes):
+    """Replace a file so a crash leaves either the old or the new contents"""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+    # Persist the rename itself
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+def _drop_page_cache(f):
+    """Flush a finished log and let the kernel evict its cached pages"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        f.flush()
+        os.fdatasync(f.fileno())
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+    except OSError:
+        pass
+
+
+# Read size when mirroring command output to console and log
+PIPE_CHUNK_SIZE = 1 << 16
+
+# Phase selector: single number "1", range "1-3", or "all"
+_PHASE_RANGE_RE = re.compile(r"^(\d+)(?:-(\d+))?$|^all$", re.I)
+
 
 class PhaseStatus(Enum):
     """Status of a phase execution"""
@@ -41,197 +153,308 @@ class PhaseStatus(Enum):
     SKIPPED = "skipped"
 
 
+PhaseInfo = namedtuple("PhaseInfo", "name command duration_estimate description deps")
+
+
 @dataclass
 class PhaseResult:
     """Result of a phase execution"""
     phase_number: int
     phase_name: str
     status: PhaseStatus
-    start_time: Optional[str] = None
-    end_time: Optional[str] = None
+    start_time: Optional[float] = None  # epoch seconds
+    end_time: Optional[float] = None  # epoch seconds
     duration_seconds: Optional[float] = None
     error_message: Optional[str] = None
     command_used: Optional[str] = None
     output_file: Optional[str] = None
 
+    @property
+    def start_iso(self) -> Optional[str]:
+        return _epoch_to_iso(self.start_time)
+
+    @property
+    def end_iso(self) -> Optional[str]:
+        return _epoch_to_iso(self.end_time)
+
+    def to_dict(self) -> Dict:
+        """Serialize to a JSON-compatible dict, with ISO times for reading"""
+        return {
+            'phase_number': self.phase_number,
+            'phase_name': self.phase_name,
+            'status': self.status.value,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'start_iso': self.start_iso,
+            'end_iso': self.end_iso,
+            'duration_seconds': self.duration_seconds,
+            'error_message': self.error_message,
+            'command_used': self.command_used,
+            'output_file': self.output_file
+        }
+
+    @classmethod
+    def from_dict(cls, r: Dict) -> "PhaseResult":
+        """Build a result from its serialized form"""
+        return cls(
+            phase_number=r['phase_number'],
+            phase_name=r['phase_name'],
+            status=PhaseStatus(r['status']),
+            start_time=_to_epoch(r.get('start_time')),
+            end_time=_to_epoch(r.get('end_time')),
+            duration_seconds=r.get('duration_seconds'),
+            error_message=r.get('error_message'),
+            command_used=r.get('command_used'),
+            output_file=r.get('output_file')
+        )
+
 
 class DocjaysOrchestrator:
     """Orchestrates the execution of Docjays implementation phases"""
 
-    # Phase definitions
+    # Phase definitions; "deps" lists phases that must complete first
     PHASES = {
         1: {
             "name": "Database Foundation",
             "command": "docjays-phase1",
             "duration_estimate": "1-2 weeks",
-            "description": "Enhanced schema with taxonomy, lifecycle tracking, usage metadata"
+            "description": "Enhanced schema with taxonomy, lifecycle tracking, usage metadata",
+            "deps": []
         },
         2: {
             "name": "Lifecycle Management APIs",
             "command": "docjays-phase2",
             "duration_estimate": "1-2 weeks",
-            "description": "Grounding API with metadata, approval workflow, lifecycle operations"
+            "description": "Grounding API with metadata, approval workflow, lifecycle operations",
+            "deps": [1]
         },
         3: {
             "name": "Compliance Checking",
             "command": "docjays-phase3",
             "duration_estimate": "1-2 weeks",
-            "description": "Real-time constraint enforcement, LLM-based compliance analysis"
+            "description": "Real-time constraint enforcement, LLM-based compliance analysis",
+            "deps": [2]
         },
         4: {
             "name": "Decision Extraction",
             "command": "docjays-phase4",
             "duration_estimate": "1-2 weeks",
-            "description": "Auto-extract decisions from PRs, commits, documents"
+            "description": "Auto-extract decisions from PRs, commits, documents",
+            "deps": [3]
         },
         5: {
             "name": "UI Enhancement",
             "command": "docjays-phase5",
             "duration_estimate": "1-2 weeks",
-            "description": "Governance dashboard, grounding modal, compliance UI"
+            "description": "Governance dashboard, grounding modal, compliance UI",
+            "deps": [3]
         },
         6: {
             "name": "MCP & CLI Tools",
             "command": "docjays-phase6",
             "duration_estimate": "1-2 weeks",
-            "description": "Enhanced MCP tools, CLI commands, workflow integration"
+            "description": "Enhanced MCP tools, CLI commands, workflow integration",
+            "deps": [4]
         },
         7: {
             "name": "Testing & Deployment",
             "command": "docjays-phase7",
             "duration_estimate": "1-2 weeks",
-            "description": "Comprehensive testing, gradual rollout, monitoring"
+            "description": "Comprehensive testing, gradual rollout, monitoring",
+            "deps": [5, 6]
         }
     }
+    _PHASE_IDS = frozenset(PHASES)
+    _MAX_PHASE_ID = max(PHASES)
 
-    def __init__(self, project_root: str, dry_run: bool = False):
+    # Phase ids are dense, so index a tuple by id (slot 0 unused)
+    if sorted(PHASES) != list(range(1, len(PHASES) + 1)):
+        raise ValueError("PHASES must be numbered contiguously from 1")
+    _PHASE_TUPLE = (None,) + tuple(PhaseInfo(**info) for _, info in sorted(PHASES.items()))
+
+    def __init__(self, project_root: str, dry_run: bool = False, jobs: int = 1,
+                 phase_pause: float = 5, load_existing: bool = True):
         self.project_root = Path(project_root)
         self.dry_run = dry_run
-        self.results: List[PhaseResult] = []
+        self.jobs = max(1, jobs)
+        self.phase_pause = phase_pause
+        self._stop_evt = threading.Event()
+        self._by_phase: Dict[int, PhaseResult] = {}
+        # Results produced by this run, kept on top of anything reloaded
+        self._recorded: Dict[int, PhaseResult] = {}
+
+        # Resolve the CLI once; phases exec it directly without a shell
+        claude = shutil.which("claude")
+        if claude is None and not dry_run:
+            raise RuntimeError(
+                "claude CLI not found on PATH. "
+                "Install it with: npm install -g @anthropic-ai/claude-code"
+            )
+        self._claude = claude or "claude"
+
+        # Per-phase argv and command strings, indexed like _PHASE_TUPLE
+        self._phase_argv = (None,) + tuple(
+            [self._claude, f"/{info.command}"] for info in self._PHASE_TUPLE[1:]
+        )
+        self._phase_command = (None,) + tuple(
+            shlex.join(argv) for argv in self._phase_argv[1:]
+        )
+
         self.progress_file = self.project_root / "scripts" / "docjays-progress.json"
+        self.progress_log_file = self.progress_file.with_suffix(".jsonl")
+        self.progress_lock_file = self.progress_file.with_suffix(".lock")
         self.output_dir = self.project_root / "scripts" / "outputs"
-        self.output_dir.mkdir(exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._progress_mtime = None
+
+        # Append-only log, one line per finished phase; opened on first write
+        self._progress_log = None
 
         # Load progress if exists
-        self.load_progress()
+        if load_existing:
+            self.load_progress()
+
+    @property
+    def results(self) -> List[PhaseResult]:
+        """Latest result for each phase"""
+        return list(self._by_phase.values())
 
     def load_progress(self):
-        """Load previous progress from file"""
+        """Load previous progress from the snapshot and the progress log"""
+        by_phase: Dict[int, PhaseResult] = {}
+        self._progress_mtime = None
+
         if self.progress_file.exists():
-            with open(self.progress_file, 'r') as f:
-                data = json.load(f)
-                self.results = [
-                    PhaseResult(
-                        phase_number=r['phase_number'],
-                        phase_name=r['phase_name'],
-                        status=PhaseStatus(r['status']),
-                        start_time=r.get('start_time'),
-                        end_time=r.get('end_time'),
-                        duration_seconds=r.get('duration_seconds'),
-                        error_message=r.get('error_message'),
-                        command_used=r.get('command_used'),
-                        output_file=r.get('output_file')
-                    )
-                    for r in data.get('results', [])
-                ]
-
-    def save_progress(self):
-        """Save current progress to file"""
-        data = {
-            'last_updated': datetime.now().isoformat(),
-            'results': [
-                {
-                    'phase_number': r.phase_number,
-                    'phase_name': r.phase_name,
-                    'status': r.status.value,
-                    'start_time': r.start_time,
-                    'end_time': r.end_time,
-                    'duration_seconds': r.duration_seconds,
-                    'error_message': r.error_message,
-                    'command_used': r.command_used,
-                    'output_file': r.output_file
-                }
-                for r in self.results
-            ]
-        }
+            self._progress_mtime = self.progress_file.stat().st_mtime_ns
+            with _mapped(self.progress_file) as mm:
+                if mm is not None:
+                    with memoryview(mm) as view:
+                        data = _loads(view)
+                    for r in data.get('results', []):
+                        by_phase[r['phase_number']] = PhaseResult.from_dict(r)
+
+        # Later log entries supersede the snapshot and earlier attempts
+        if self.progress_log_file.exists():
+            with _mapped(self.progress_log_file) as mm:
+                for line in iter(mm.readline, b"") if mm is not None else ():
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        r = _loads(line)
+                    except ValueError:
+                        # Torn final line from an interrupted write
+                        continue
+                    by_phase[r['phase_number']] = PhaseResult.from_dict(r)
+
+        self._by_phase = by_phase
+
+    @contextmanager
+    def _progress_lock(self):
+        """Hold an exclusive lock on the progress files across runs (POSIX only)"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.progress_lock_file, 'a') as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def record_progress(self, result: PhaseResult):
+        """Append a single phase result to the progress log"""
+        with self._progress_lock():
+            if self._progress_log is None:
+                self._progress_log = open(self.progress_log_file, 'ab', buffering=0)
+                # Terminate a torn last line so this record starts on its own line
+                if self._progress_log.tell() > 0:
+                    with open(self.progress_log_file, 'rb') as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            self._progress_log.write(b"\n")
+            self._progress_log.write(_dumps(result.to_dict(), indent=False) + b"\n")
+
+    def save_snapshot(self):
+        """Merge everything on disk into the snapshot, then empty the log"""
+        if self.dry_run:
+            return
+
+        with self._progress_lock():
+            if self.progress_file.exists() and \
+                    self.progress_file.stat().st_mtime_ns != self._progress_mtime:
+                print("⚠️  Progress file changed on disk, merging before saving")
+
+            # The log may hold lines from other runs, including ones that
+            # never saved; fold them in and keep this run's results on top
+            self.load_progress()
+            self._by_phase.update(self._recorded)
+
+            data = {
+                'last_updated': _datetime().now().isoformat(),
+                'results': [r.to_dict() for r in self.results]
+            }
+
+            _atomic_write(self.progress_file, _dumps(data))
+            self._progress_mtime = self.progress_file.stat().st_mtime_ns
+
+            # Everything the log held is now in the snapshot
+            if self.progress_log_file.exists():
+                os.truncate(self.progress_log_file, 0)
 
-        with open(self.progress_file, 'w') as f:
-            json.dump(data, f, indent=2)
+    def execute_phase(self, phase_number: int, echo: bool = True) -> PhaseResult:
+        """Execute a single phase
 
-    def execute_phase(self, phase_number: int) -> PhaseResult:
-        """Execute a single phase"""
-        phase_info = self.PHASES.get(phase_number)
-        if not phase_info:
+        Args:
+            phase_number: Phase to execute
+            echo: Mirror command output to the console as well as the log file
+        """
+        if phase_number not in self._PHASE_IDS:
             raise ValueError(f"Invalid phase number: {phase_number}")
 
+        phase_info = self._PHASE_TUPLE[phase_number]
         result = PhaseResult(
             phase_number=phase_number,
-            phase_name=phase_info['name'],
+            phase_name=phase_info.name,
             status=PhaseStatus.IN_PROGRESS
         )
 
         print(f"\n{'='*80}")
-        print(f"Phase {phase_number}: {phase_info['name']}")
-        print(f"Description: {phase_info['description']}")
-        print(f"Estimated Duration: {phase_info['duration_estimate']}")
+        print(f"Phase {phase_number}: {phase_info.name}")
+        print(f"Description: {phase_info.description}")
+        print(f"Estimated Duration: {phase_info.duration_estimate}")
         print(f"{'='*80}\n")
 
+        argv = self._phase_argv[phase_number]
         if self.dry_run:
             print("[DRY RUN] Would execute command:")
-            print(f"  claude /{phase_info['command']}")
+            print(f"  claude {argv[1]}")
             result.status = PhaseStatus.SKIPPED
-            result.command_used = f"/{phase_info['command']}"
+            result.command_used = argv[1]
             return result
 
         # Prepare output file
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        start_dt, start_iso, timestamp = _now()
         output_file = self.output_dir / f"phase{phase_number}_{timestamp}.log"
 
         # Execute Claude Code command
-        command = f"claude /{phase_info['command']}"
+        command = self._phase_command[phase_number]
         result.command_used = command
-        result.start_time = datetime.now().isoformat()
+        result.start_time = start_dt.timestamp()
 
         print(f"Executing: {command}")
         print(f"Output will be saved to: {output_file}")
         print("\nStarting execution...\n")
 
+        # Monotonic clock for duration; start_time is for display only
+        t0 = time.perf_counter()
         try:
-            # Run claude command
-            process = subprocess.Popen(
-                command,
-                shell=True,
-                cwd=str(self.project_root),
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
+            return_code = asyncio.run(
+                self._execute_phase_async(argv, output_file, start_iso, echo)
             )
 
-            # Stream output to console and file
-            with open(output_file, 'w') as f:
-                f.write(f"Command: {command}\n")
-                f.write(f"Start Time: {result.start_time}\n")
-                f.write(f"{'='*80}\n\n")
-
-                for line in process.stdout:
-                    print(line, end='')
-                    f.write(line)
-
-                # Write stderr if any
-                stderr = process.stderr.read()
-                if stderr:
-                    print(f"\nSTDERR:\n{stderr}")
-                    f.write(f"\n\nSTDERR:\n{stderr}")
-
-            # Wait for completion
-            return_code = process.wait()
-
-            result.end_time = datetime.now().isoformat()
-            start = datetime.fromisoformat(result.start_time)
-            end = datetime.fromisoformat(result.end_time)
-            result.duration_seconds = (end - start).total_seconds()
+            result.duration_seconds = time.perf_counter() - t0
+            result.end_time = time.time()
             result.output_file = str(output_file)
 
             if return_code == 0:
@@ -246,82 +469,261 @@ class DocjaysOrchestrator:
         except Exception as e:
             result.status = PhaseStatus.FAILED
             result.error_message = str(e)
-            result.end_time = datetime.now().isoformat()
+            result.end_time = time.time()
             print(f"\n❌ Phase {phase_number} failed with exception: {e}")
 
         return result
 
+    async def _execute_phase_async(self, argv: List[str], output_file: Path, start_time: str,
+                                   echo: bool = True) -> int:
+        """Run the phase command, draining stdout and stderr concurrently into the log"""
+
+        async def pump(reader: asyncio.StreamReader, sinks):
+            # Copy raw chunks rather than decoded lines
+            while True:
+                chunk = await reader.read(PIPE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                for sink in sinks:
+                    sink.write(chunk)
+                    sink.flush()
+
+        sys.stdout.flush()
+        with open(output_file, 'wb') as f:
+            f.write(f"Command: {shlex.join(argv)}\n".encode())
+            f.write(f"Start Time: {start_time}\n".encode())
+            f.write(f"{'='*80}\n\n".encode())
+            f.flush()
+
+            try:
+                if not echo:
+                    # Log only: the child writes straight into the file
+                    process = await asyncio.create_subprocess_exec(
+                        *argv,
+                        stdout=f,
+                        stderr=f,
+                        cwd=str(self.project_root)
+                    )
+                    return await process.wait()
+
+                # Stream output to console and file
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=str(self.project_root)
+                )
+                await asyncio.gather(
+                    pump(process.stdout, (sys.stdout.buffer, f)),
+                    pump(process.stderr, (sys.stderr.buffer, f))
+                )
+
+                # Wait for completion
+                return await process.wait()
+            finally:
+                _drop_page_cache(f)
+
     def run_phases(self, phase_range: str):
         """Run specified phases
 
         Args:
             phase_range: "all", single number "1", or range "1-3"
         """
-        if phase_range.lower() == "all":
-            phases_to_run = list(self.PHASES.keys())
-        elif "-" in phase_range:
-            start, end = map(int, phase_range.split("-"))
-            phases_to_run = list(range(start, end + 1))
+        match = _PHASE_RANGE_RE.match(phase_range.strip())
+        if not match:
+            raise ValueError(f"Invalid phase range: {phase_range}")
+
+        start, end = match.groups()
+        if start is None:
+            phases_to_run = sorted(self._PHASE_IDS)
+        elif end is None:
+            phases_to_run = [int(start)]
         else:
-            phases_to_run = [int(phase_range)]
+            phases_to_run = list(range(int(start), int(end) + 1))
 
         print(f"\n🚀 Docjays Implementation Orchestrator")
         print(f"Project: {self.project_root}")
         print(f"Phases to run: {phases_to_run}")
         print(f"Dry run: {self.dry_run}")
+        print(f"Parallel jobs: {self.jobs}")
         print(f"\n")
 
+        pending = set()
         for phase_num in phases_to_run:
-            if phase_num not in self.PHASES:
+            if phase_num not in self._PHASE_IDS:
                 print(f"⚠️  Warning: Phase {phase_num} not found, skipping")
                 continue
 
             # Check if phase already completed
-            existing = next((r for r in self.results if r.phase_number == phase_num), None)
+            existing = self._by_phase.get(phase_num)
             if existing and existing.status == PhaseStatus.COMPLETED:
                 print(f"\n✓ Phase {phase_num} already completed, skipping")
-                print(f"  Completed at: {existing.end_time}")
+                print(f"  Completed at: {existing.end_iso}")
                 print(f"  Duration: {existing.duration_seconds:.2f}s")
                 continue
 
-            # Execute phase
-            result = self.execute_phase(phase_num)
+            pending.add(phase_num)
+
+        # A dependency outside the requested range counts as satisfied unless
+        # it is recorded as not completed; phases blocked that way are skipped
+        blocked = set()
+        for p in sorted(pending):
+            for d in self._PHASE_TUPLE[p].deps:
+                recorded = self._by_phase.get(d)
+                if d in blocked or (d not in pending and recorded is not None
+                                    and recorded.status != PhaseStatus.COMPLETED):
+                    print(f"⚠️  Warning: Phase {p} depends on Phase {d}, which has not completed; skipping")
+                    blocked.add(p)
+                    break
+        pending -= blocked
+
+        waiting_on = {
+            p: {d for d in self._PHASE_TUPLE[p].deps if d in pending}
+            for p in pending
+        }
+
+        # Ctrl-C ends the inter-phase pause at once, then interrupts as usual.
+        # Signal handlers can only be installed from the main thread.
+        self._stop_evt.clear()
+        in_main_thread = threading.current_thread() is threading.main_thread()
+        if in_main_thread:
+            previous_handler = signal.signal(signal.SIGINT, self._handle_sigint)
+        try:
+            if self.jobs == 1:
+                failed_phase = self._run_sequential(pending, waiting_on)
+            else:
+                failed_phase = self._run_parallel(pending, waiting_on)
+        finally:
+            if in_main_thread:
+                signal.signal(signal.SIGINT, previous_handler)
 
-            # Update results
-            if existing:
-                self.results.remove(existing)
-            self.results.append(result)
+        if failed_phase is not None:
+            print(f"\n❌ Stopping execution due to failure in Phase {failed_phase.phase_number}")
+            print(f"Error: {failed_phase.error_message}")
+            print(f"\nTo resume from the failed phase, run:")
+            print(f"  python scripts/run-docjays-phases.py --resume-from {failed_phase.phase_number}")
 
-            # Save progress after each phase
-            self.save_progress()
+        # Generate final report
+        self.generate_report()
+
+    def _handle_sigint(self, signum, frame):
+        """Wake any pending pause, then raise KeyboardInterrupt"""
+        self._stop_evt.set()
+        signal.default_int_handler(signum, frame)
+
+    def _pause_between_phases(self):
+        """Wait phase_pause seconds, returning early on Ctrl-C"""
+        if not self.dry_run and self.phase_pause:
+            print(f"\n⏸️  Pausing for {self.phase_pause:g} seconds before next phase...")
+            self._stop_evt.wait(self.phase_pause)
+
+    def _run_sequential(self, pending: set, waiting_on: Dict[int, set]) -> Optional[PhaseResult]:
+        """Run pending phases one at a time in this process, in dependency order
+
+        Returns:
+            The failed phase's result, or None if every phase completed
+        """
+        while pending:
+            phase_num = min(p for p in pending if not waiting_on[p])
+            pending.discard(phase_num)
 
-            # Stop if phase failed (unless continuing on error)
+            result = self.execute_phase(phase_num)
+            self._record_result(result)
             if result.status == PhaseStatus.FAILED:
-                print(f"\n❌ Stopping execution due to failure in Phase {phase_num}")
-                print(f"Error: {result.error_message}")
-                print(f"\nTo resume from next phase, run:")
-                print(f"  python scripts/run-docjays-phases.py --resume-from {phase_num + 1}")
-                break
+                return result
 
-            # Pause between phases
-            if phase_num < max(phases_to_run):
-                print(f"\n⏸️  Pausing for 5 seconds before next phase...")
-                time.sleep(5)
+            for deps in waiting_on.values():
+                deps.discard(phase_num)
 
-        # Generate final report
-        self.generate_report()
+            if pending:
+                self._pause_between_phases()
+
+        return None
+
+    def _run_parallel(self, pending: set, waiting_on: Dict[int, set]) -> Optional[PhaseResult]:
+        """Run pending phases in worker processes as their dependencies complete
+
+        Returns:
+            The first failed phase's result, or None if every phase completed
+        """
+        failed_phase = None
+
+        with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+            running = {}
+
+            def submit_ready():
+                # Never queue beyond the free workers, so a failure stops
+                # phases that have not started yet
+                for p in sorted(pending):
+                    if len(running) >= self.jobs:
+                        break
+                    if not waiting_on[p]:
+                        pending.discard(p)
+                        future = executor.submit(
+                            _run_one_phase, str(self.project_root), p, self.dry_run
+                        )
+                        running[future] = p
+
+            submit_ready()
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    phase_num = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = PhaseResult(
+                            phase_number=phase_num,
+                            phase_name=self._PHASE_TUPLE[phase_num].name,
+                            status=PhaseStatus.FAILED,
+                            error_message=str(e)
+                        )
+
+                    self._record_result(result)
+
+                    if result.status == PhaseStatus.FAILED:
+                        if failed_phase is None:
+                            failed_phase = result
+                        continue
+
+                    for deps in waiting_on.values():
+                        deps.discard(phase_num)
+
+                # Stop scheduling on failure, but let running phases finish
+                if failed_phase is not None:
+                    pending.clear()
+                    continue
+
+                if pending and not running:
+                    self._pause_between_phases()
+                submit_ready()
+
+        return failed_phase
+
+    def _record_result(self, result: PhaseResult):
+        """Replace any previous result for the phase and log it"""
+        self._by_phase[result.phase_number] = result
+        self._recorded[result.phase_number] = result
+
+        # Record progress after each phase; dry runs only preview
+        if not self.dry_run:
+            self.record_progress(result)
 
     def generate_report(self):
         """Generate execution report"""
+        # Merge progress from disk first so the report matches the snapshot
+        self.save_snapshot()
+
         print(f"\n{'='*80}")
         print("EXECUTION REPORT")
         print(f"{'='*80}\n")
 
-        completed = [r for r in self.results if r.status == PhaseStatus.COMPLETED]
-        failed = [r for r in self.results if r.status == PhaseStatus.FAILED]
-        skipped = [r for r in self.results if r.status == PhaseStatus.SKIPPED]
+        results = self.results
+        completed = [r for r in results if r.status == PhaseStatus.COMPLETED]
+        failed = [r for r in results if r.status == PhaseStatus.FAILED]
+        skipped = [r for r in results if r.status == PhaseStatus.SKIPPED]
 
-        print(f"Total Phases: {len(self.results)}")
+        print(f"Total Phases: {len(results)}")
         print(f"Completed: {len(completed)}")
         print(f"Failed: {len(failed)}")
         print(f"Skipped: {len(skipped)}")
@@ -332,7 +734,7 @@ class DocjaysOrchestrator:
             for r in completed:
                 print(f"  Phase {r.phase_number}: {r.phase_name}")
                 print(f"    Duration: {r.duration_seconds:.2f}s")
-                print(f"    Completed: {r.end_time}")
+                print(f"    Completed: {r.end_iso}")
 
         if failed:
             print("\n❌ FAILED:")
@@ -352,28 +754,39 @@ class DocjaysOrchestrator:
             print(f"\nTotal execution time: {total_time:.2f}s ({total_time/60:.2f} minutes)")
 
         # Save detailed report
-        report_file = self.output_dir / f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump({
-                'generated_at': datetime.now().isoformat(),
-                'summary': {
-                    'total': len(self.results),
-                    'completed': len(completed),
-                    'failed': len(failed),
-                    'skipped': len(skipped)
-                },
-                'results': [asdict(r) for r in self.results]
-            }, f, indent=2, default=str)
+        _, generated_at, timestamp = _now()
+        report_file = self.output_dir / f"report_{timestamp}.json"
+        summary = {
+            'total': len(results),
+            'completed': len(completed),
+            'failed': len(failed),
+            'skipped': len(skipped)
+        }
+        # Stream one result per line instead of serializing one large document
+        with open(report_file, 'wb') as f:
+            f.write(b'{\n  "generated_at": ' + _dumps(generated_at, indent=False))
+            f.write(b',\n  "summary": ' + _dumps(summary, indent=False))
+            f.write(b',\n  "results": [')
+            for i, r in enumerate(results):
+                f.write(b',\n    ' if i else b'\n    ')
+                f.write(_dumps(r.to_dict(), indent=False))
+            f.write(b'\n  ]\n}\n')
 
         print(f"\nDetailed report saved to: {report_file}")
         print(f"Progress file: {self.progress_file}")
 
     def resume_from(self, phase_number: int):
         """Resume execution from a specific phase"""
-        remaining_phases = [p for p in self.PHASES.keys() if p >= phase_number]
+        remaining_phases = [p for p in sorted(self._PHASE_IDS) if p >= phase_number]
         print(f"\n🔄 Resuming from Phase {phase_number}")
         print(f"Remaining phases: {remaining_phases}")
-        self.run_phases(f"{phase_number}-{max(self.PHASES.keys())}")
+        self.run_phases(f"{phase_number}-{self._MAX_PHASE_ID}")
+
+
+def _run_one_phase(project_root: str, phase_number: int, dry_run: bool) -> PhaseResult:
+    """Execute a single phase in a worker process, writing output only to its log"""
+    orchestrator = DocjaysOrchestrator(project_root, dry_run=dry_run, load_existing=False)
+    return orchestrator.execute_phase(phase_number, echo=False)
 
 
 def main():
@@ -396,6 +809,9 @@ Examples:
 
   # Resume from phase 3
   python scripts/run-docjays-phases.py --resume-from 3
+
+  # Run independent phases in parallel
+  python scripts/run-docjays-phases.py --phase all --jobs 2
         """
     )
 
@@ -418,6 +834,21 @@ Examples:
         help='Preview commands without executing'
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Run up to N independent phases in parallel (default: 1)'
+    )
+
+    parser.add_argument(
+        '--phase-pause',
+        type=float,
+        metavar='SECONDS',
+        help='Pause between sequential phases (default: 5, or 0 with --dry-run)'
+    )
+
     parser.add_argument(
         '--project-root',
         type=str,
@@ -430,16 +861,31 @@ Examples:
     # Validate arguments
     if not args.phase and not args.resume_from:
         parser.error("Either --phase or --resume-from must be specified")
+    if args.phase and not _PHASE_RANGE_RE.match(args.phase.strip()):
+        parser.error(f'Invalid --phase value "{args.phase}": use a number (1), range (1-3), or "all"')
 
     # Get project root
     project_root = Path(args.project_root).resolve()
-    if not (project_root / '.claude').exists():
+    if not args.dry_run and not (project_root / '.claude').exists():
         print(f"❌ Error: .claude directory not found in {project_root}")
         print("   Make sure you're running from the project root")
         sys.exit(1)
 
     # Create orchestrator
-    orchestrator = DocjaysOrchestrator(str(project_root), dry_run=args.dry_run)
+    try:
+        phase_pause = args.phase_pause
+        if phase_pause is None:
+            phase_pause = 0 if args.dry_run else 5
+        orchestrator = DocjaysOrchestrator(
+            str(project_root),
+            dry_run=args.dry_run,
+            jobs=args.jobs,
+            phase_pause=phase_pause,
+            load_existing=not args.dry_run
+        )
+    except RuntimeError as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
 
     try:
         if args.resume_from:
@@ -448,14 +894,13 @@ Examples:
             orchestrator.run_phases(args.phase)
     except KeyboardInterrupt:
         print("\n\n⚠️  Execution interrupted by user")
-        orchestrator.save_progress()
         orchestrator.generate_report()
         sys.exit(1)
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
         import traceback
         traceback.print_exc()
-        orchestrator.save_progress()
+        orchestrator.save_snapshot()
         sys.exit(1)
 
 
@@ -0,0 +1,255 @@
+"""Tests for the Docjays implementation orchestrator (run-docjays-phases.py)"""
+
+import importlib.util
+import json
+import os
+import stat
+import sys
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent / "run-docjays-phases.py"
+
+spec = importlib.util.spec_from_file_location("run_docjays_phases", SCRIPT)
+orchestrator_mod = importlib.util.module_from_spec(spec)
+# Registered so worker processes can unpickle results and task functions
+sys.modules[spec.name] = orchestrator_mod
+spec.loader.exec_module(orchestrator_mod)
+
+DocjaysOrchestrator = orchestrator_mod.DocjaysOrchestrator
+PhaseStatus = orchestrator_mod.PhaseStatus
+
+FAKE_CLAUDE = """#!/bin/sh
+echo "$1" >> "$CALLS_FILE"
+case "$1" in "/docjays-phase$FAIL_PHASE") exit 3;; esac
+exit 0
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project root with a fake claude on PATH that records its calls"""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    claude = bin_dir / "claude"
+    claude.write_text(FAKE_CLAUDE)
+    claude.chmod(claude.stat().st_mode | stat.S_IEXEC)
+
+    root = tmp_path / "project"
+    (root / "scripts").mkdir(parents=True)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("CALLS_FILE", str(tmp_path / "calls.txt"))
+    monkeypatch.setenv("FAIL_PHASE", "0")
+    return root
+
+
+def called_phases(project):
+    calls = project.parent / "calls.txt"
+    if not calls.exists():
+        return []
+    return [int(line.rsplit("phase", 1)[1]) for line in calls.read_text().split()]
+
+
+def write_snapshot(project, results):
+    path = project / "scripts" / "docjays-progress.json"
+    path.write_text(json.dumps({"last_updated": "2026-01-25T15:30:12", "results": results}))
+
+
+def entry(phase, status, **extra):
+    return {
+        "phase_number": phase,
+        "phase_name": f"Phase {phase}",
+        "status": status,
+        "duration_seconds": 1.0,
+        **extra
+    }
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake claude is a shell script")
+class TestScheduling:
+    def test_runs_all_phases_in_dependency_order(self, project):
+        orchestrator = DocjaysOrchestrator(str(project), phase_pause=0)
+        orchestrator.run_phases("all")
+
+        assert called_phases(project) == [1, 2, 3, 4, 5, 6, 7]
+        assert all(r.status == PhaseStatus.COMPLETED for r in orchestrator.results)
+
+    def test_stops_on_failure(self, project, monkeypatch):
+        monkeypatch.setenv("FAIL_PHASE", "3")
+        orchestrator = DocjaysOrchestrator(str(project), phase_pause=0)
+        orchestrator.run_phases("all")
+
+        assert called_phases(project) == [1, 2, 3]
+        assert orchestrator._by_phase[3].status == PhaseStatus.FAILED
+
+    def test_parallel_never_starts_dependents_of_failed_phase(self, project, monkeypatch):
+        monkeypatch.setenv("FAIL_PHASE", "4")
+        orchestrator = DocjaysOrchestrator(str(project), jobs=2, phase_pause=0)
+        orchestrator.run_phases("all")
+
+        calls = called_phases(project)
+        assert calls[:3] == [1, 2, 3]
+        assert 6 not in calls and 7 not in calls
+
+    def test_skips_phase_whose_earlier_dependency_failed(self, project):
+        write_snapshot(project, [entry(3, "completed"), entry(4, "failed")])
+        orchestrator = DocjaysOrchestrator(str(project), phase_pause=0)
+        orchestrator.run_phases("5-7")
+
+        assert called_phases(project) == [5]
+
+    def test_skips_completed_phases(self, project):
+        write_snapshot(project, [entry(1, "completed")])
+        orchestrator = DocjaysOrchestrator(str(project), phase_pause=0)
+        orchestrator.run_phases("1-2")
+
+        assert called_phases(project) == [2]
+
+
+class TestProgress:
+    def test_log_entries_supersede_snapshot(self, project):
+        write_snapshot(project, [entry(1, "failed"), entry(2, "completed")])
+        log = project / "scripts" / "docjays-progress.jsonl"
+        log.write_text(
+            json.dumps(entry(1, "failed")) + "\n"
+            + json.dumps(entry(1, "completed")) + "\n"
+            + '{"phase_number": 3, "phase_na'
+        )
+
+        orchestrator = DocjaysOrchestrator(str(project), dry_run=True)
+
+        statuses = {r.phase_number: r.status for r in orchestrator.results}
+        assert statuses == {1: PhaseStatus.COMPLETED, 2: PhaseStatus.COMPLETED}
+
+    def test_record_after_torn_line_is_kept(self, project):
+        log = project / "scripts" / "docjays-progress.jsonl"
+        log.write_text('{"phase_number": 1, "phase_na')
+
+        orchestrator = DocjaysOrchestrator(str(project), dry_run=True)
+        orchestrator.record_progress(
+            orchestrator_mod.PhaseResult(1, "Phase 1", PhaseStatus.COMPLETED)
+        )
+
+        reloaded = DocjaysOrchestrator(str(project), dry_run=True)
+        assert reloaded._by_phase[1].status == PhaseStatus.COMPLETED
+
+    def test_snapshot_folds_log_into_snapshot_before_emptying_it(self, project):
+        log = project / "scripts" / "docjays-progress.jsonl"
+        log.write_text(json.dumps(entry(1, "completed")) + "\n")
+
+        orchestrator = DocjaysOrchestrator(str(project), dry_run=True)
+        orchestrator.dry_run = False
+        # A line from another run lands after this one loaded
+        with open(log, "a") as f:
+            f.write(json.dumps(entry(3, "completed")) + "\n")
+        orchestrator._record_result(
+            orchestrator_mod.PhaseResult(2, "Phase 2", PhaseStatus.COMPLETED)
+        )
+        orchestrator.save_snapshot()
+
+        assert log.read_bytes() == b""
+        reloaded = DocjaysOrchestrator(str(project), dry_run=True)
+        assert sorted(reloaded._by_phase) == [1, 2, 3]
+
+    def test_loads_baseline_progress_file(self, project):
+        write_snapshot(project, [{
+            "phase_number": 1,
+            "phase_name": "Database Foundation",
+            "status": "completed",
+            "start_time": "2026-01-25T14:30:22",
+            "end_time": "2026-01-25T15:12:45",
+            "duration_seconds": 2543.12,
+            "error_message": None,
+            "command_used": "/docjays-phase1",
+            "output_file": "scripts/outputs/phase1_20260125_143022.log"
+        }])
+
+        result = DocjaysOrchestrator(str(project), dry_run=True)._by_phase[1]
+
+        assert result.status == PhaseStatus.COMPLETED
+        assert result.start_time == datetime(2026, 1, 25, 14, 30, 22).timestamp()
+        assert result.end_iso == "2026-01-25T15:12:45"
+        assert result.duration_seconds == 2543.12
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fake claude is a shell script")
+class TestPause:
+    def test_pauses_again_on_reused_instance(self, project, monkeypatch):
+        orchestrator = DocjaysOrchestrator(str(project), phase_pause=0.01)
+        waits = []
+        real_wait = orchestrator._stop_evt.wait
+        monkeypatch.setattr(
+            orchestrator._stop_evt, "wait", lambda t: waits.append(real_wait(t))
+        )
+        orchestrator._stop_evt.set()
+
+        orchestrator.run_phases("1-2")
+
+        # A stale stop from an earlier run must not cut this run's pause short
+        assert waits == [False]
+
+    def test_runs_outside_main_thread(self, project):
+        orchestrator = DocjaysOrchestrator(str(project), phase_pause=0)
+        errors = []
+
+        def run():
+            try:
+                orchestrator.run_phases("1")
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join()
+
+        assert errors == []
+        assert called_phases(project) == [1]
+
+
+class TestConcurrentWriters:
+    def test_save_keeps_own_results_after_other_run_saved(self, project):
+        run_a = DocjaysOrchestrator(str(project), phase_pause=0)
+        run_b = DocjaysOrchestrator(str(project), phase_pause=0)
+        run_a._record_result(orchestrator_mod.PhaseResult(1, "Phase 1", PhaseStatus.COMPLETED))
+        run_b._record_result(orchestrator_mod.PhaseResult(5, "Phase 5", PhaseStatus.COMPLETED))
+
+        run_b.save_snapshot()
+        run_a.save_snapshot()
+
+        assert sorted(run_a._by_phase) == [1, 5]
+        reloaded = DocjaysOrchestrator(str(project), dry_run=True)
+        assert sorted(reloaded._by_phase) == [1, 5]
+
+    def test_save_keeps_log_lines_of_run_that_never_saved(self, project):
+        crashed = DocjaysOrchestrator(str(project), phase_pause=0)
+        run_b = DocjaysOrchestrator(str(project), phase_pause=0)
+        crashed._record_result(orchestrator_mod.PhaseResult(1, "Phase 1", PhaseStatus.COMPLETED))
+        run_b._record_result(orchestrator_mod.PhaseResult(5, "Phase 5", PhaseStatus.COMPLETED))
+
+        run_b.save_snapshot()
+
+        reloaded = DocjaysOrchestrator(str(project), dry_run=True)
+        assert sorted(reloaded._by_phase) == [1, 5]
+
+
+class TestReport:
+    def test_report_includes_progress_merged_from_disk(self, project):
+        orchestrator = DocjaysOrchestrator(str(project), phase_pause=0)
+        orchestrator._record_result(orchestrator_mod.PhaseResult(
+            2, "Phase 2", PhaseStatus.COMPLETED, duration_seconds=1.0
+        ))
+        # Another run's result arrives in the shared log
+        with open(project / "scripts" / "docjays-progress.jsonl", "a") as f:
+            f.write(json.dumps(entry(1, "completed")) + "\n")
+
+        orchestrator.generate_report()
+
+        report_file, = (project / "scripts" / "outputs").glob("report_*.json")
+        report = json.loads(report_file.read_text())
+        snapshot = json.loads((project / "scripts" / "docjays-progress.json").read_text())
+        assert report["summary"]["total"] == 2
+        assert [r["phase_number"] for r in report["results"]] == \
+            [r["phase_number"] for r in snapshot["results"]]